@@ -7,16 +7,61 @@ Get notified when someone stars your repository
 import os
 import sys
 import argparse
-import json
+import asyncio
+import random
+import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import aiohttp
+import orjson
 import requests
 from dotenv import load_dotenv
-import schedule
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import uvloop
+except ImportError:  # optional speedup; not available on Windows
+    uvloop = None
 
 load_dotenv()
 
+# Upper bound on concurrent /users/{login} lookups
+USER_INFO_WORKERS = 16
+
+# One worker per webhook so Slack and Discord are notified concurrently
+NOTIFY_WORKERS = 2
+
+# Stars per webhook message: Slack allows 50 blocks (two go to the header
+# and repository sections) and Discord allows 10 embeds
+SLACK_BATCH_SIZE = 48
+DISCORD_BATCH_SIZE = 10
+
+# Stargazer pages that time out are retried at half size, down to this floor
+MIN_STARGAZERS_PER_PAGE = 25
+# GitHub caps per_page at 100; a larger value would make a full page look short
+MAX_STARGAZERS_PER_PAGE = 100
+STARGAZER_PAGE_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_connect=30, sock_read=30)
+
+# Media type that wraps each stargazer as {"starred_at": ..., "user": {...}}
+STAR_MEDIA_TYPE = 'application/vnd.github.v3.star+json'
+
+# Webhook payloads are serialized with orjson rather than requests' json=
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Cached user profiles are served without a request for this long
+USER_CACHE_TTL = 24 * 60 * 60
+
+# Below this many remaining API calls the user info fan-out runs serially
+RATE_LIMIT_THRESHOLD = 100
+
+# Bounds for the adaptive poll interval, in seconds
+MIN_POLL_INTERVAL = 30
+MAX_POLL_INTERVAL = 3600
+
 class GitHubStarNotifier:
     def __init__(self):
         self.token = os.getenv('GITHUB_TOKEN')
@@ -32,189 +77,428 @@ class GitHubStarNotifier:
             'Accept': 'application/vnd.github.v3+json'
         }
         
+        # Shared session so GitHub and webhook calls reuse pooled keep-alive connections.
+        # Auth headers are passed per GitHub call so the token never reaches the webhooks.
+        # 429s are left to _get, which waits for the rate-limit reset instead of backing off blindly.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.rate_limit_remaining = None
+        
+        # Known stars are persisted incrementally in SQLite; WAL keeps each commit cheap
+        self.db = sqlite3.connect('stars.db')
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS stars (id INTEGER PRIMARY KEY, login TEXT, seen_at TEXT)')
+        self.db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        
+        # ETag of the last stargazer page, used to skip polls when nothing changed
+        meta = dict(self.db.execute('SELECT key, value FROM meta'))
+        self.last_page = int(meta.get('last_page', 1))
+        self.last_etag = meta.get('last_etag')
+        self.last_page_count = int(meta.get('last_page_count', 0))
+        # Newest starred_at seen, so polls can stop reading once they reach older stars
+        self.last_starred_at = meta.get('last_starred_at')
+        
         self.state_file = 'stars_state.json'
         self.known_stars = self.load_state()
         
+        self.user_cache_file = 'users_cache.json'
+        self.user_cache = self.load_user_cache()
+        self.user_cache_dirty = False
+        
         # Notification settings
         self.slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
         self.discord_webhook = os.getenv('DISCORD_WEBHOOK_URL')
         self.email_enabled = os.getenv('EMAIL_NOTIFICATIONS', 'false').lower() == 'true'
         self.email_to = os.getenv('EMAIL_TO')
         self.min_followers = int(os.getenv('MIN_FOLLOWERS', 0))
+        
+        # Static webhook fragments, built once and shared by every message
+        self._slack_repo_block = {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*Repository:*\n{self.repo}"
+            }
+        }
+        self._discord_base_embed = {
+            "title": "⭐ New Star!",
+            "description": f"Someone starred **{self.repo}**",
+            "color": 0x5865F2
+        }
+        
+        # Large 100-item stargazer pages regularly time out on GitHub's side
+        per_page = int(os.getenv('STARGAZERS_PER_PAGE', 80))
+        self.per_page = min(max(per_page, MIN_STARGAZERS_PER_PAGE), MAX_STARGAZERS_PER_PAGE)
     
     def load_state(self) -> set:
-        """Load known stars from state file"""
-        if os.path.exists(self.state_file):
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
-                return set(data.get('known_stars', []))
-        return set()
+        """Load known star ids from the database"""
+        known = set(row[0] for row in self.db.execute('SELECT id FROM stars'))
+        if not known and os.path.exists(self.state_file):
+            known = self.import_legacy_state()
+        return known
+    
+    def import_legacy_state(self) -> set:
+        """Import known stars from the old JSON state file into the database"""
+        with open(self.state_file, 'rb') as f:
+            data = orjson.loads(f.read())
+        known = set(data.get('known_star_ids', []))
+        known.update(int(star.rsplit('_', 1)[1]) for star in data.get('known_stars', []))
+        with self.db:
+            self.db.executemany('INSERT OR IGNORE INTO stars (id) VALUES (?)', [(star_id,) for star_id in known])
+        return known
+    
+    def save_state(self, new_stars: List[Dict]):
+        """Record new stars in the database in a single transaction"""
+        seen_at = datetime.now().isoformat()
+        with self.db:
+            self.db.executemany(
+                'INSERT OR IGNORE INTO stars VALUES (?, ?, ?)',
+                [(stargazer['id'], stargazer['login'], seen_at) for stargazer in new_stars]
+            )
+            self.db.executemany(
+                'INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                [
+                    ('last_page', str(self.last_page)),
+                    ('last_etag', self.last_etag),
+                    ('last_page_count', str(self.last_page_count)),
+                    ('last_starred_at', self.last_starred_at)
+                ]
+            )
+        self.save_user_cache()
+    
+    def load_user_cache(self) -> Dict:
+        """Load cached user profiles from disk"""
+        if os.path.exists(self.user_cache_file):
+            with open(self.user_cache_file, 'rb') as f:
+                return orjson.loads(f.read())
+        return {}
     
-    def save_state(self):
-        """Save known stars to state file"""
-        data = {
-            'known_stars': list(self.known_stars),
-            'last_check': datetime.now().isoformat()
+    def save_user_cache(self):
+        """Save cached user profiles to disk if any were fetched or refreshed"""
+        if not self.user_cache_dirty:
+            return
+        # Drop expired profiles so the file does not grow with every stargazer ever seen
+        now = datetime.now()
+        self.user_cache = {
+            login: entry for login, entry in self.user_cache.items()
+            if (now - datetime.fromisoformat(entry['fetched_at'])).total_seconds() < USER_CACHE_TTL
         }
-        with open(self.state_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(self.user_cache_file, 'wb') as f:
+            f.write(orjson.dumps(self.user_cache))
+        self.user_cache_dirty = False
     
-    def get_stargazers(self) -> List[Dict]:
-        """Get list of stargazers for the repository"""
+    def get_stargazers(self, conditional: bool = False) -> List[Dict]:
+        """Get list of stargazers (conditional: only those starred since the last call)"""
+        return asyncio.run(self._get_stargazers_async(conditional))
+    
+    async def _get_stargazers_async(self, conditional: bool = False) -> List[Dict]:
+        """Fetch one stargazer page, then all remaining pages concurrently"""
         url = f"https://api.github.com/repos/{self.repo}/stargazers"
-        stargazers = []
-        page = 1
-        per_page = 100
+        per_page = self.per_page
+        # Bound in-flight requests to stay clear of GitHub's secondary rate limits
+        semaphore = asyncio.Semaphore(10)
         
-        while True:
-            params = {'page': page, 'per_page': per_page}
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
+        # Once stars before the watermark are known, only the tail needs reading
+        since = self.last_starred_at if conditional else None
+        
+        headers = {**self.headers, 'Accept': STAR_MEDIA_TYPE}
+        async with aiohttp.ClientSession(headers=headers, timeout=STARGAZER_PAGE_TIMEOUT) as session:
+            # New stars are appended to the last page, so if that page is unchanged
+            # (304, free of rate-limit cost) there is nothing new. A full last page
+            # stays unchanged while stars spill onto the next one, so it is read
+            # unconditionally and its Link header shows whether a next page exists.
+            probe_page, etag = 1, None
+            if conditional and self.last_etag:
+                probe_page = self.last_page
+                if self.last_page_count < per_page:
+                    etag = self.last_etag
+            while True:
+                try:
+                    data, response = await self._fetch_stargazer_page(session, semaphore, url, probe_page, per_page, etag)
+                    break
+                except asyncio.TimeoutError:
+                    if per_page <= MIN_STARGAZERS_PER_PAGE:
+                        raise self._page_timeout_error(probe_page, per_page) from None
+                    # Page boundaries move with per_page, so start over from the first page
+                    per_page = self._reduce_per_page(per_page)
+                    probe_page, etag = 1, None
+            if data is None:
+                return []
+            if not data and probe_page > 1:
+                # Unstars shrank the list below the old last page
+                probe_page = 1
+                data, response = await self._fetch_stargazer_page(session, semaphore, url, probe_page, per_page)
             
-            data = response.json()
-            if not data:
-                break
+            # GitHub's Link header has rel="next" and rel="last" on every page but the last
+            links = response.links
+            last_page = int(links['last']['url'].query['page']) if 'next' in links else probe_page
             
-            for stargazer in data:
-                stargazers.append({
-                    'login': stargazer['login'],
-                    'id': stargazer['id'],
-                    'avatar_url': stargazer['avatar_url'],
-                    'html_url': stargazer['html_url']
-                })
+            pages = {probe_page: (data, response.headers.get('ETag'))}
+            if since:
+                other_pages = list(range(probe_page + 1, last_page + 1))
+            else:
+                other_pages = [page for page in range(1, last_page + 1) if page != probe_page]
+            if other_pages:
+                results = await asyncio.gather(*[
+                    self._fetch_stargazer_span(session, semaphore, url, page, per_page)
+                    for page in other_pages
+                ])
+                pages.update(zip(other_pages, results))
             
-            # Check if there are more pages
-            if len(data) < per_page:
-                break
-            page += 1
+            if since:
+                # Unstars can shift the watermark onto earlier pages; walk back
+                # until a page starts with a star older than it
+                first_page = probe_page
+                while first_page > 1 and pages[first_page][0] and pages[first_page][0][0]['starred_at'] >= since:
+                    first_page -= 1
+                    pages[first_page] = await self._fetch_stargazer_span(session, semaphore, url, first_page, per_page)
+        
+        self.last_page = last_page
+        self.last_etag = pages[last_page][1]
+        self.last_page_count = len(pages[last_page][0])
+        if per_page != self.per_page:
+            # A page was split, so last_page no longer matches the new page size
+            self.last_etag = None
+        
+        # Unwrap the star+json items, tagging each user object with starred_at in place
+        stargazers = []
+        for page in sorted(pages):
+            for star in pages[page][0]:
+                star['user']['starred_at'] = star['starred_at']
+                stargazers.append(star['user'])
+        
+        # Stars from the watermark's own second are kept; known ids filter them later
+        if since:
+            stargazers = [stargazer for stargazer in stargazers if stargazer['starred_at'] >= since]
+        if stargazers:
+            self.last_starred_at = stargazers[-1]['starred_at']
         
         return stargazers
     
+    async def _fetch_stargazer_span(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                    url: str, page: int, per_page: int):
+        """Fetch one page's stargazers and ETag, refetching them as smaller pages on timeout"""
+        try:
+            data, response = await self._fetch_stargazer_page(session, semaphore, url, page, per_page)
+            return data, response.headers.get('ETag')
+        except asyncio.TimeoutError:
+            if per_page <= MIN_STARGAZERS_PER_PAGE:
+                raise self._page_timeout_error(page, per_page) from None
+            smaller = self._reduce_per_page(per_page)
+            # Page boundaries differ between sizes, so cover the page's item
+            # offsets with the smaller pages and trim the overlap at both ends
+            start = (page - 1) * per_page
+            first_page = start // smaller + 1
+            last_page = (page * per_page - 1) // smaller + 1
+            results = await asyncio.gather(*[
+                self._fetch_stargazer_span(session, semaphore, url, sub_page, smaller)
+                for sub_page in range(first_page, last_page + 1)
+            ])
+            items = [item for data, _ in results for item in data]
+            offset = start - (first_page - 1) * smaller
+            return items[offset:offset + per_page], None
+    
+    def _reduce_per_page(self, per_page: int) -> int:
+        """Halve the stargazer page size after a timeout, remembering it for later polls"""
+        smaller = max(MIN_STARGAZERS_PER_PAGE, per_page // 2)
+        if smaller < self.per_page:
+            self.per_page = smaller
+            print(f"⚠️  Stargazer page timed out, lowering page size to {smaller} "
+                  f"(set STARGAZERS_PER_PAGE={smaller} to keep it)")
+        return smaller
+    
+    def _page_timeout_error(self, page: int, per_page: int) -> RuntimeError:
+        """Build the error raised once a page times out at the smallest page size"""
+        # Not a TimeoutError, so enclosing page splits don't retry it again
+        return RuntimeError(f"Stargazer page {page} of {self.repo} timed out even at "
+                            f"{per_page} items per page")
+    
+    async def _fetch_stargazer_page(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                    url: str, page: int, per_page: int, etag: Optional[str] = None):
+        """Fetch a single stargazer page, returning its items (None if not modified) and the response"""
+        params = {'page': page, 'per_page': per_page}
+        headers = {'If-None-Match': etag} if etag else None
+        for attempt in range(2):
+            async with semaphore:
+                async with session.get(url, params=params, headers=headers) as response:
+                    self._record_rate_limit(response.headers)
+                    if response.status == 304:
+                        return None, response
+                    delay = self._rate_limit_delay(response.status, response.headers)
+                    if delay is None or attempt:
+                        response.raise_for_status()
+                        data = await response.json(loads=orjson.loads)
+                        return data, response
+            print(f"⏳ Rate limited, waiting {delay:.0f}s")
+            await asyncio.sleep(delay)
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET a GitHub API URL, waiting out a rate limit once before giving up"""
+        kwargs.setdefault('headers', self.headers)
+        response = self.session.get(url, **kwargs)
+        self._record_rate_limit(response.headers)
+        delay = self._rate_limit_delay(response.status_code, response.headers)
+        if delay is not None:
+            print(f"⏳ Rate limited, waiting {delay:.0f}s")
+            time.sleep(delay)
+            response = self.session.get(url, **kwargs)
+            self._record_rate_limit(response.headers)
+        return response
+    
+    def _rate_limit_delay(self, status: int, headers) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, or None if not limited"""
+        if status not in (403, 429):
+            return None
+        # Secondary rate limits tell us how long to back off directly
+        if 'Retry-After' in headers:
+            return float(headers['Retry-After'])
+        if headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+            return max(0, int(headers['X-RateLimit-Reset']) - time.time()) + 1
+        return None
+    
+    def _record_rate_limit(self, headers):
+        """Remember the remaining primary rate-limit quota"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            self.rate_limit_remaining = int(remaining)
+    
     def get_user_info(self, username: str) -> Optional[Dict]:
-        """Get detailed user information"""
+        """Get detailed user information, served from the user cache when fresh"""
+        cached = self.user_cache.get(username)
+        headers = self.headers
+        if cached:
+            age = (datetime.now() - datetime.fromisoformat(cached['fetched_at'])).total_seconds()
+            if age < USER_CACHE_TTL:
+                return cached['data']
+            # Revalidate; a 304 does not count against the rate limit
+            if cached.get('etag'):
+                headers = {**self.headers, 'If-None-Match': cached['etag']}
+        
         url = f"https://api.github.com/users/{username}"
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._get(url, headers=headers)
+            if response.status_code == 304:
+                cached['fetched_at'] = datetime.now().isoformat()
+                self.user_cache_dirty = True
+                return cached['data']
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content)
+            self.user_cache[username] = {
+                'fetched_at': datetime.now().isoformat(),
+                'etag': response.headers.get('ETag'),
+                'data': data
+            }
+            self.user_cache_dirty = True
+            return data
         except Exception as e:
             print(f"❌ Error fetching user info for {username}: {e}")
             return None
     
-    def send_slack_notification(self, star_info: Dict):
-        """Send notification to Slack"""
+    def send_slack_batch(self, star_infos: List[Dict]):
+        """Send one Slack message per batch of new stars"""
         if not self.slack_webhook:
             return
         
-        try:
-            message = {
-                "text": f"⭐ New Star on {self.repo}!",
-                "blocks": [
-                    {
-                        "type": "header",
+        for i in range(0, len(star_infos), SLACK_BATCH_SIZE):
+            batch = star_infos[i:i + SLACK_BATCH_SIZE]
+            try:
+                title = "⭐ New Star!" if len(batch) == 1 else f"⭐ {len(batch)} New Stars!"
+                message = {
+                    "text": f"{title} on {self.repo}",
+                    "blocks": [
+                        {
+                            "type": "header",
+                            "text": {
+                                "type": "plain_text",
+                                "text": title
+                            }
+                        },
+                        self._slack_repo_block
+                    ]
+                }
+                
+                for star_info in batch:
+                    lines = [f"*Stargazer:* <{star_info['html_url']}|@{star_info['login']}>"]
+                    if star_info.get('name'):
+                        lines.append(f"*Name:* {star_info['name']}")
+                    if star_info.get('bio'):
+                        lines.append(f"*Bio:* {star_info['bio']}")
+                    if star_info.get('followers') is not None:
+                        lines.append(f"*Followers:* {star_info['followers']:,}")
+                    
+                    message["blocks"].append({
+                        "type": "section",
                         "text": {
-                            "type": "plain_text",
-                            "text": "⭐ New Star!"
+                            "type": "mrkdwn",
+                            "text": "\n".join(lines)
                         }
-                    },
-                    {
-                        "type": "section",
-                        "fields": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Repository:*\n{self.repo}"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Stargazer:*\n<{star_info['html_url']}|@{star_info['login']}>"
-                            }
-                        ]
-                    }
-                ]
-            }
-            
-            if star_info.get('name'):
-                message["blocks"].append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Name:* {star_info['name']}"
-                    }
-                })
-            
-            if star_info.get('bio'):
-                message["blocks"].append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Bio:* {star_info['bio']}"
-                    }
-                })
-            
-            if star_info.get('followers') is not None:
-                message["blocks"].append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Followers:* {star_info['followers']:,}"
-                    }
-                })
-            
-            requests.post(self.slack_webhook, json=message)
-        except Exception as e:
-            print(f"❌ Slack notification error: {e}")
+                    })
+                
+                self.session.post(self.slack_webhook, data=orjson.dumps(message), headers=JSON_HEADERS)
+            except Exception as e:
+                print(f"❌ Slack notification error: {e}")
     
-    def send_discord_notification(self, star_info: Dict):
-        """Send notification to Discord"""
+    def send_discord_batch(self, star_infos: List[Dict]):
+        """Send one Discord message per batch of new stars, one embed each"""
         if not self.discord_webhook:
             return
         
-        try:
-            embed = {
-                "title": "⭐ New Star!",
-                "description": f"Someone starred **{self.repo}**",
-                "color": 0x5865F2,
-                "fields": [
-                    {
-                        "name": "Stargazer",
-                        "value": f"[@{star_info['login']}]({star_info['html_url']})",
-                        "inline": True
-                    }
-                ],
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            if star_info.get('name'):
-                embed["fields"].append({
-                    "name": "Name",
-                    "value": star_info['name'],
-                    "inline": True
-                })
-            
-            if star_info.get('bio'):
-                embed["description"] += f"\n\n**Bio:** {star_info['bio']}"
-            
-            if star_info.get('followers') is not None:
-                embed["fields"].append({
-                    "name": "Followers",
-                    "value": f"{star_info['followers']:,}",
+        for i in range(0, len(star_infos), DISCORD_BATCH_SIZE):
+            try:
+                embeds = [self._discord_embed(star_info) for star_info in star_infos[i:i + DISCORD_BATCH_SIZE]]
+                message = {"embeds": embeds}
+                self.session.post(self.discord_webhook, data=orjson.dumps(message), headers=JSON_HEADERS)
+            except Exception as e:
+                print(f"❌ Discord notification error: {e}")
+    
+    def _discord_embed(self, star_info: Dict) -> Dict:
+        """Build the Discord embed for a single new star"""
+        # Shallow copy: only fields, description and timestamp differ per star
+        embed = {
+            **self._discord_base_embed,
+            "fields": [
+                {
+                    "name": "Stargazer",
+                    "value": f"[@{star_info['login']}]({star_info['html_url']})",
                     "inline": True
-                })
-            
-            message = {"embeds": [embed]}
-            requests.post(self.discord_webhook, json=message)
-        except Exception as e:
-            print(f"❌ Discord notification error: {e}")
+                }
+            ],
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        if star_info.get('name'):
+            embed["fields"].append({
+                "name": "Name",
+                "value": star_info['name'],
+                "inline": True
+            })
+        
+        if star_info.get('bio'):
+            embed["description"] += f"\n\n**Bio:** {star_info['bio']}"
+        
+        if star_info.get('followers') is not None:
+            embed["fields"].append({
+                "name": "Followers",
+                "value": f"{star_info['followers']:,}",
+                "inline": True
+            })
+        
+        return embed
     
-    def check_new_stars(self):
-        """Check for new stars and send notifications"""
+    def check_new_stars(self) -> List[Dict]:
+        """Check for new stars and send notifications, returning the new stargazers"""
         print(f"🔍 Checking stars for {self.repo}...")
         
-        stargazers = self.get_stargazers()
+        stargazers = self.get_stargazers(conditional=True)
         new_stars = []
         
         for stargazer in stargazers:
-            star_id = f"{stargazer['login']}_{stargazer['id']}"
+            star_id = stargazer['id']
             if star_id not in self.known_stars:
                 new_stars.append(stargazer)
                 self.known_stars.add(star_id)
@@ -222,80 +506,143 @@ class GitHubStarNotifier:
         if new_stars:
             print(f"✅ Found {len(new_stars)} new star(s)!")
             
-            for stargazer in new_stars:
-                # Get detailed user info
-                user_info = self.get_user_info(stargazer['login'])
+            # Profiles are only needed for the follower filter and rich notifications
+            needs_detail = self.min_followers > 0 or any([self.slack_webhook, self.discord_webhook, self.email_enabled])
+            if needs_detail:
+                # Fetch detailed user info for all new stargazers in parallel,
+                # falling back to serial requests when the quota is nearly spent
+                workers = USER_INFO_WORKERS
+                if self.rate_limit_remaining is not None and self.rate_limit_remaining < RATE_LIMIT_THRESHOLD:
+                    workers = 1
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    user_infos = list(executor.map(self.get_user_info, [s['login'] for s in new_stars]))
+            else:
+                user_infos = [{} for _ in new_stars]
+            
+            star_infos = []
+            for stargazer, user_info in zip(new_stars, user_infos):
+                if user_info is None:
+                    # Lookup failed and was already reported
+                    continue
+                
+                # Filter by minimum followers
+                if user_info.get('followers', 0) < self.min_followers:
+                    print(f"⏭️  Skipping {stargazer['login']} (followers < {self.min_followers})")
+                    continue
                 
+                star_info = {
+                    'login': stargazer['login'],
+                    'html_url': stargazer['html_url'],
+                    'starred_at': stargazer['starred_at']
+                }
                 if user_info:
-                    # Filter by minimum followers
-                    if user_info.get('followers', 0) < self.min_followers:
-                        print(f"⏭️  Skipping {stargazer['login']} (followers < {self.min_followers})")
-                        continue
-                    
-                    star_info = {
-                        'login': stargazer['login'],
-                        'html_url': stargazer['html_url'],
+                    star_info.update({
                         'name': user_info.get('name'),
                         'bio': user_info.get('bio'),
                         'followers': user_info.get('followers', 0),
                         'location': user_info.get('location'),
-                        'company': user_info.get('company'),
-                        'starred_at': datetime.now().isoformat()
-                    }
-                    
-                    # Send notifications
-                    self.send_slack_notification(star_info)
-                    self.send_discord_notification(star_info)
-                    
-                    # Print to console
-                    print(f"\n⭐ New Star!")
-                    print(f"   User: @{star_info['login']} ({star_info.get('name', 'N/A')})")
-                    if star_info.get('bio'):
-                        print(f"   Bio: {star_info['bio']}")
+                        'company': user_info.get('company')
+                    })
+                
+                star_infos.append(star_info)
+                
+                # Print to console
+                print(f"\n⭐ New Star!")
+                print(f"   User: @{star_info['login']} ({star_info.get('name', 'N/A')})")
+                if star_info.get('bio'):
+                    print(f"   Bio: {star_info['bio']}")
+                if star_info.get('followers') is not None:
                     print(f"   Followers: {star_info['followers']:,}")
-                    if star_info.get('location'):
-                        print(f"   Location: {star_info['location']}")
+                if star_info.get('location'):
+                    print(f"   Location: {star_info['location']}")
+            
+            # Batched webhooks go out concurrently; leaving the pool waits for
+            # them so state is saved after they complete
+            if star_infos:
+                with ThreadPoolExecutor(max_workers=NOTIFY_WORKERS) as notify_pool:
+                    notify_pool.submit(self.send_slack_batch, star_infos)
+                    notify_pool.submit(self.send_discord_batch, star_infos)
         else:
             print("✓ No new stars")
         
-        self.save_state()
+        self.save_state(new_stars)
+        return new_stars
+    
+    def get_recent_stargazers(self, n: int = 10) -> Tuple[int, List[Dict]]:
+        """Get the total star count and the n most recent stargazers, newest first"""
+        # Stargazers are listed oldest first, so the newest sit on the last page
+        url = f"https://api.github.com/repos/{self.repo}/stargazers"
+        response = self._get(url, params={'page': 1, 'per_page': n})
+        response.raise_for_status()
+        recent = orjson.loads(response.content)
+        total = len(recent)
+        
+        if 'last' in response.links:
+            last_page = int(parse_qs(urlparse(response.links['last']['url']).query)['page'][0])
+            response = self._get(url, params={'page': last_page, 'per_page': n})
+            response.raise_for_status()
+            recent = orjson.loads(response.content)
+            total = (last_page - 1) * n + len(recent)
+            
+            # A partial last page is topped up from the one before it
+            if len(recent) < n:
+                response = self._get(url, params={'page': last_page - 1, 'per_page': n})
+                response.raise_for_status()
+                recent = orjson.loads(response.content) + recent
+        
+        return total, recent[::-1][:n]
     
     def show_history(self):
         """Show star history"""
-        stargazers = self.get_stargazers()
+        total, recent = self.get_recent_stargazers(10)
         print(f"\n📊 Star History for {self.repo}")
         print("="*60)
-        print(f"Total Stars: {len(stargazers)}")
+        print(f"Total Stars: {total}")
         print("\nRecent Stargazers:")
         
-        for i, stargazer in enumerate(stargazers[:10], 1):
-            user_info = self.get_user_info(stargazer['login'])
+        with ThreadPoolExecutor(max_workers=USER_INFO_WORKERS) as executor:
+            user_infos = list(executor.map(self.get_user_info, [s['login'] for s in recent]))
+        
+        for i, (stargazer, user_info) in enumerate(zip(recent, user_infos), 1):
             if user_info:
                 print(f"{i}. @{stargazer['login']} - {user_info.get('name', 'N/A')} ({user_info.get('followers', 0):,} followers)")
+        
+        self.save_user_cache()
     
     def run_continuous(self, interval: int = 300):
-        """Run continuous monitoring"""
-        print(f"🚀 Starting continuous star monitoring (checking every {interval}s)")
+        """Run continuous monitoring, adapting the interval to the star arrival rate"""
+        print(f"🚀 Starting continuous star monitoring (initial interval {interval}s)")
         
-        schedule.every(interval).seconds.do(self.check_new_stars)
-        
-        # Initial check
-        self.check_new_stars()
+        # Back off while the repo is quiet and tighten up while stars arrive,
+        # within [30s, 1h] widened to include the requested interval
+        min_interval = min(MIN_POLL_INTERVAL, interval)
+        max_interval = max(MAX_POLL_INTERVAL, interval)
+        self.current_interval = interval
         
         while True:
-            schedule.run_pending()
-            time.sleep(60)
+            started = time.monotonic()
+            if self.check_new_stars():
+                self.current_interval = max(min_interval, self.current_interval / 2)
+            else:
+                self.current_interval = min(max_interval, self.current_interval * 1.5)
+            
+            # Jitter spreads polls from many instances across the interval
+            jitter = random.uniform(-0.1 * self.current_interval, 0.1 * self.current_interval)
+            time.sleep(max(0, started + self.current_interval + jitter - time.monotonic()))
 
 
 def main():
     parser = argparse.ArgumentParser(description='GitHub Star Notifier')
     parser.add_argument('--check-once', action='store_true', help='Check once and exit')
     parser.add_argument('--history', action='store_true', help='Show star history')
-    parser.add_argument('--interval', type=int, default=300, help='Check interval in seconds (default: 300)')
+    parser.add_argument('--interval', type=int, default=300, help='Initial check interval in seconds, adapted to star activity (default: 300)')
     parser.add_argument('--min-followers', type=int, default=0, help='Minimum followers to notify')
     
     args = parser.parse_args()
     
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         notifier = GitHubStarNotifier()
         notifier.min_followers = args.min_followers
@@ -0,0 +1,35 @@
+import orjson
+
+
+def star_infos(count: int) -> list:
+    return [
+        {'login': f'user{i}', 'html_url': f'https://github.com/user{i}', 'name': f'User {i}', 'followers': i}
+        for i in range(count)
+    ]
+
+
+def record_posts(notifier, monkeypatch) -> list:
+    posts = []
+    monkeypatch.setattr(notifier.session, 'post', lambda url, data, headers: posts.append((url, orjson.loads(data))))
+    return posts
+
+
+def test_slack_batches_split_at_48_stars(notifier, monkeypatch) -> None:
+    notifier.slack_webhook = 'https://hooks.slack.test/x'
+    posts = record_posts(notifier, monkeypatch)
+
+    notifier.send_slack_batch(star_infos(100))
+
+    # Header and repository blocks plus one section per star, at most 50 blocks
+    assert [len(message['blocks']) for _, message in posts] == [50, 50, 6]
+    assert posts[-1][1]['blocks'][0]['text']['text'] == '⭐ 4 New Stars!'
+
+
+def test_discord_batches_split_at_10_embeds(notifier, monkeypatch) -> None:
+    notifier.discord_webhook = 'https://discord.test/x'
+    posts = record_posts(notifier, monkeypatch)
+
+    notifier.send_discord_batch(star_infos(21))
+
+    assert [len(message['embeds']) for _, message in posts] == [10, 10, 1]
+    assert posts[0][1]['embeds'][0]['title'] == '⭐ New Star!'
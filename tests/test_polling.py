@@ -0,0 +1,39 @@
+import pytest
+
+import notify
+
+
+class StopPolling(Exception):
+    pass
+
+
+def poll_intervals(notifier, monkeypatch, interval: int, results: list) -> list:
+    """Run run_continuous over scripted check results, returning the interval after each poll"""
+    pending = iter(results)
+    intervals = []
+
+    def sleep(seconds):
+        intervals.append(notifier.current_interval)
+        if len(intervals) == len(results):
+            raise StopPolling
+
+    monkeypatch.setattr(notifier, 'check_new_stars', lambda: next(pending))
+    monkeypatch.setattr(notify.time, 'sleep', sleep)
+    with pytest.raises(StopPolling):
+        notifier.run_continuous(interval)
+    return intervals
+
+
+def test_interval_backs_off_while_quiet(notifier, monkeypatch) -> None:
+    intervals = poll_intervals(notifier, monkeypatch, 300, [[]] * 7)
+    assert intervals == [450, 675, 1012.5, 1518.75, 2278.125, 3417.1875, 3600]
+
+
+def test_interval_tightens_while_stars_arrive(notifier, monkeypatch) -> None:
+    intervals = poll_intervals(notifier, monkeypatch, 300, [[{'id': 1}]] * 5)
+    assert intervals == [150, 75, 37.5, 30, 30]
+
+
+def test_bounds_widen_to_include_requested_interval(notifier, monkeypatch) -> None:
+    assert poll_intervals(notifier, monkeypatch, 10, [[{'id': 1}]] * 2) == [10, 10]
+    assert poll_intervals(notifier, monkeypatch, 7200, [[]] * 2) == [7200, 7200]
@@ -0,0 +1,64 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+import notify
+
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    """Answers the first request with a primary-limit 429, then 200"""
+
+    requests_seen = 0
+
+    def do_GET(self) -> None:
+        type(self).requests_seen += 1
+        if type(self).requests_seen == 1:
+            self.send_response(429)
+            self.send_header('X-RateLimit-Remaining', '0')
+            self.send_header('X-RateLimit-Reset', str(int(time.time()) + 600))
+        else:
+            self.send_response(200)
+            self.send_header('X-RateLimit-Remaining', '4999')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    RateLimitedHandler.requests_seen = 0
+    httpd = HTTPServer(('127.0.0.1', 0), RateLimitedHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}/'
+    httpd.shutdown()
+
+
+def test_get_waits_for_reset_on_429(notifier, server, monkeypatch) -> None:
+    # Route the local server through the same adapter GitHub calls use
+    notifier.session.mount('http://', notifier.session.get_adapter('https://api.github.com'))
+    sleeps = []
+    monkeypatch.setattr(notify.time, 'sleep', sleeps.append)
+
+    response = notifier._get(server)
+
+    assert response.status_code == 200
+    assert RateLimitedHandler.requests_seen == 2
+    assert len(sleeps) == 1 and 599 <= sleeps[0] <= 601
+    assert notifier.rate_limit_remaining == 4999
+
+
+def test_rate_limit_delay_retry_after(notifier) -> None:
+    assert notifier._rate_limit_delay(403, {'Retry-After': '5'}) == 5.0
+    assert notifier._rate_limit_delay(200, {'Retry-After': '5'}) is None
+
+
+def test_rate_limit_delay_reset(notifier) -> None:
+    headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 60)}
+    assert 59 <= notifier._rate_limit_delay(403, headers) <= 61
+    assert notifier._rate_limit_delay(403, {'X-RateLimit-Remaining': '10'}) is None
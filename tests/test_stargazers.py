@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from yarl import URL
+
+import notify
+
+
+class FakeStargazers:
+    """In-memory stand-in for GitHub's paginated stargazers endpoint"""
+
+    def __init__(self, count: int) -> None:
+        self.stars = []
+        self.next_id = 1
+        self.timeouts = set()
+        self.add(count)
+
+    def add(self, count: int) -> None:
+        base = datetime(2024, 1, 1)
+        for _ in range(count):
+            starred_at = (base + timedelta(minutes=self.next_id)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            self.stars.append({'starred_at': starred_at, 'user': {'id': self.next_id, 'login': f'user{self.next_id}'}})
+            self.next_id += 1
+
+    def remove(self, *ids: int) -> None:
+        self.stars = [star for star in self.stars if star['user']['id'] not in ids]
+
+    async def fetch(self, session, semaphore, url, page, per_page, etag=None):
+        if (page, per_page) in self.timeouts:
+            raise asyncio.TimeoutError
+        # GitHub silently caps page sizes at 100
+        per_page = min(per_page, 100)
+        items = self.stars[(page - 1) * per_page:page * per_page]
+        body_etag = hashlib.sha1(repr(items).encode()).hexdigest()
+        last_page = max(1, -(-len(self.stars) // per_page))
+        links = {}
+        if page < last_page:
+            links = {
+                'next': {'url': URL(f'https://api.github.com/stargazers?page={page + 1}&per_page={per_page}')},
+                'last': {'url': URL(f'https://api.github.com/stargazers?page={last_page}&per_page={per_page}')}
+            }
+        response = SimpleNamespace(links=links, headers={'ETag': body_etag})
+        if etag == body_etag:
+            return None, response
+        # Fresh dicts per response, as the real client would decode them
+        return [{'starred_at': star['starred_at'], 'user': dict(star['user'])} for star in items], response
+
+
+def use_fake(notifier, monkeypatch, fake: FakeStargazers, per_page: int) -> None:
+    notifier.per_page = per_page
+    monkeypatch.setattr(notifier, '_fetch_stargazer_page', fake.fetch)
+
+
+def ids(stargazers) -> list:
+    return [stargazer['id'] for stargazer in stargazers]
+
+
+def test_new_stars_after_full_last_page(notifier, monkeypatch) -> None:
+    fake = FakeStargazers(8)
+    use_fake(notifier, monkeypatch, fake, per_page=4)
+    assert ids(notifier.get_stargazers(conditional=True)) == list(range(1, 9))
+
+    fake.add(2)
+    assert ids(notifier.get_stargazers(conditional=True)) == [8, 9, 10]
+
+    # Short last page now, so an unchanged list is answered by the 304 probe
+    assert notifier.get_stargazers(conditional=True) == []
+
+
+def test_per_page_env_is_clamped(notifier, monkeypatch) -> None:
+    monkeypatch.setenv('STARGAZERS_PER_PAGE', '150')
+    assert notify.GitHubStarNotifier().per_page == 100
+    monkeypatch.setenv('STARGAZERS_PER_PAGE', '10')
+    assert notify.GitHubStarNotifier().per_page == 25
+
+
+def test_new_stars_after_full_page_with_oversized_env(notifier, monkeypatch) -> None:
+    monkeypatch.setenv('STARGAZERS_PER_PAGE', '150')
+    clamped = notify.GitHubStarNotifier()
+    fake = FakeStargazers(200)
+    monkeypatch.setattr(clamped, '_fetch_stargazer_page', fake.fetch)
+    clamped.get_stargazers(conditional=True)
+
+    fake.add(5)
+    assert ids(clamped.get_stargazers(conditional=True)) == [200, 201, 202, 203, 204, 205]
+
+
+def test_timeouts_halve_down_to_the_floor(notifier, monkeypatch) -> None:
+    fake = FakeStargazers(30)
+    fake.timeouts.update({(1, 80), (1, 40)})
+    use_fake(notifier, monkeypatch, fake, per_page=80)
+
+    assert ids(notifier.get_stargazers()) == list(range(1, 31))
+    assert notifier.per_page == 25
+
+
+def test_timeout_at_the_floor_raises_readable_error(notifier, monkeypatch) -> None:
+    fake = FakeStargazers(30)
+    fake.timeouts.update({(1, 80), (1, 40), (1, 25)})
+    use_fake(notifier, monkeypatch, fake, per_page=80)
+
+    with pytest.raises(RuntimeError, match='timed out even at 25 items per page'):
+        notifier.get_stargazers()
+
+
+def test_odd_page_size_timeout_split(notifier, monkeypatch) -> None:
+    fake = FakeStargazers(300)
+    fake.timeouts.add((2, 75))
+    use_fake(notifier, monkeypatch, fake, per_page=75)
+
+    assert ids(notifier.get_stargazers()) == list(range(1, 301))
+    assert notifier.per_page == 37
+
+
+def test_unstars_move_watermark_to_earlier_page(notifier, monkeypatch) -> None:
+    fake = FakeStargazers(10)
+    use_fake(notifier, monkeypatch, fake, per_page=4)
+    notifier.get_stargazers(conditional=True)
+
+    # Star 10 shifts from page 3 to page 2 while new stars fill page 3
+    fake.remove(1, 2)
+    fake.add(3)
+    assert ids(notifier.get_stargazers(conditional=True)) == [10, 11, 12, 13]
+    assert notifier.last_starred_at == fake.stars[-1]['starred_at']
+
+
+def fake_recent_get(users: list, calls: list):
+    """Fake for _get serving the default (oldest first) stargazers listing"""
+
+    def get(url, params):
+        calls.append(params['page'])
+        page, per_page = params['page'], params['per_page']
+        last_page = max(1, -(-len(users) // per_page))
+        links = {}
+        if page < last_page:
+            links = {'last': {'url': f'https://api.github.com/stargazers?per_page={per_page}&page={last_page}'}}
+        items = users[(page - 1) * per_page:page * per_page]
+        return SimpleNamespace(links=links, content=orjson.dumps(items), raise_for_status=lambda: None)
+
+    return get
+
+
+@pytest.mark.parametrize('count, expected_calls', [(5, [1]), (30, [1, 3]), (23, [1, 3, 2])])
+def test_recent_stargazers_total_and_newest_first(notifier, monkeypatch, count, expected_calls) -> None:
+    users = [{'id': i, 'login': f'user{i}'} for i in range(1, count + 1)]
+    calls = []
+    monkeypatch.setattr(notifier, '_get', fake_recent_get(users, calls))
+
+    total, recent = notifier.get_recent_stargazers(10)
+
+    assert total == count
+    assert ids(recent) == list(range(count, max(0, count - 10), -1))
+    assert calls == expected_calls
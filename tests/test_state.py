@@ -0,0 +1,22 @@
+import orjson
+
+import notify
+
+
+def test_legacy_state_is_imported_once(notifier) -> None:
+    with open(notifier.state_file, 'wb') as f:
+        f.write(orjson.dumps({'known_stars': ['octo_cat_42', 'hubot_7'], 'known_star_ids': [99]}))
+
+    assert notifier.load_state() == {7, 42, 99}
+    rows = notifier.db.execute('SELECT id, login FROM stars ORDER BY id').fetchall()
+    assert rows == [(7, None), (42, None), (99, None)]
+
+
+def test_new_stars_persist_across_instances(notifier) -> None:
+    notifier.last_starred_at = '2024-01-01T00:00:00Z'
+    notifier.save_state([{'id': 5, 'login': 'octo'}])
+    notifier.db.close()
+
+    reloaded = notify.GitHubStarNotifier()
+    assert reloaded.known_stars == {5}
+    assert reloaded.last_starred_at == '2024-01-01T00:00:00Z'
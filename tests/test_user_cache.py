@@ -0,0 +1,63 @@
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import orjson
+
+
+def cache_entry(age: timedelta, data: dict, etag: str = '"abc"') -> dict:
+    return {'fetched_at': (datetime.now() - age).isoformat(), 'etag': etag, 'data': data}
+
+
+def fake_response(status_code: int, body: dict = None, etag: str = None):
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={'ETag': etag} if etag else {},
+        content=orjson.dumps(body) if body is not None else b'',
+        raise_for_status=lambda: None
+    )
+
+
+def fail_if_called(*args, **kwargs):
+    raise AssertionError('fresh cache entries must not be refetched')
+
+
+def test_fresh_entry_is_served_without_request(notifier, monkeypatch) -> None:
+    notifier.user_cache['octo'] = cache_entry(timedelta(hours=1), {'login': 'octo'})
+    monkeypatch.setattr(notifier, '_get', fail_if_called)
+
+    assert notifier.get_user_info('octo') == {'login': 'octo'}
+    assert not notifier.user_cache_dirty
+
+
+def test_stale_entry_is_revalidated_with_etag(notifier, monkeypatch) -> None:
+    notifier.user_cache['octo'] = cache_entry(timedelta(days=2), {'login': 'octo'})
+    sent = []
+
+    def fake_get(url, headers):
+        sent.append(headers)
+        return fake_response(304)
+
+    monkeypatch.setattr(notifier, '_get', fake_get)
+
+    assert notifier.get_user_info('octo') == {'login': 'octo'}
+    assert sent[0]['If-None-Match'] == '"abc"'
+    assert notifier.user_cache_dirty
+    age = datetime.now() - datetime.fromisoformat(notifier.user_cache['octo']['fetched_at'])
+    assert age < timedelta(minutes=1)
+
+
+def test_save_skips_clean_cache_and_prunes_expired(notifier, monkeypatch) -> None:
+    notifier.save_user_cache()
+    assert not os.path.exists(notifier.user_cache_file)
+
+    notifier.user_cache['old'] = cache_entry(timedelta(days=2), {'login': 'old'})
+    monkeypatch.setattr(notifier, '_get', lambda url, headers: fake_response(200, {'login': 'new'}, '"new"'))
+    notifier.get_user_info('new')
+    notifier.save_user_cache()
+
+    with open(notifier.user_cache_file, 'rb') as f:
+        saved = orjson.loads(f.read())
+    assert list(saved) == ['new']
+    assert saved['new']['etag'] == '"new"'
+    assert not notifier.user_cache_dirty